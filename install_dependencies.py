@@ -15,11 +15,86 @@ Usage:
 
 import os
 import sys
+import hashlib
+import http.client
+import importlib.util
 import subprocess
 import shutil
+import tempfile
+import threading
+import urllib.request
+import zipfile
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
 
+# Bit flags for the package managers found on PATH (see detect_tools)
+WINGET = 1
+CHOCO = 2
+
+# Python packages the downloader imports, as (pip name, module name) pairs.
+# They are all installed by a single pip invocation
+PYTHON_PACKAGES = (
+    ('yt-dlp', 'yt_dlp'),
+)
+
+# Whether this interpreter runs inside a virtual environment (venv/virtualenv)
+IN_VIRTUALENV = sys.prefix != getattr(sys, 'base_prefix', sys.prefix)
+
+# Static Windows ffmpeg build used when no package manager can install it
+FFMPEG_ZIP_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+
+
+# Serializes console output from installs running in parallel threads
+_print_lock = threading.Lock()
+
+# Serializes updates of os.environ['PATH'] from parallel installs
+_path_lock = threading.Lock()
+
+
+def log(message=""):
+    """
+    Print a message without interleaving output from concurrent installs.
+    
+    Args:
+        message (str): The message to print
+    """
+    with _print_lock:
+        print(message)
+
+
+@lru_cache(maxsize=None)
+def which(command):
+    """
+    Memoized shutil.which, since every lookup scans each PATH directory.
+    
+    Call which.cache_clear() after anything that may have changed PATH.
+    
+    Args:
+        command (str): Name of the executable to look up
+        
+    Returns:
+        str: Full path to the executable, or None if it is not on PATH
+    """
+    return shutil.which(command)
+
+
+def detect_tools():
+    """
+    Look up the supported package managers once.
+    
+    Returns:
+        int: Bitmask of the WINGET/CHOCO flags for the tools on PATH
+    """
+    tools = 0
+    for name, flag in (('winget', WINGET), ('choco', CHOCO)):
+        if which(name):
+            tools |= flag
+    return tools
+
+
 def print_header():
     """Print a welcome header."""
     print("=" * 60)
@@ -39,26 +114,24 @@ def check_python_version():
 
 def check_pip_availability():
     """Check if pip is available and install it if missing."""
-    # Try different pip commands
-    pip_commands = ['pip', f'{sys.executable} -m pip']
+    # Look for the pip module in this interpreter without starting a new one.
+    # This is the pip the installer runs, via sys.executable -m pip
+    if importlib.util.find_spec('pip') is not None:
+        print(f"✓ pip is available via: {sys.executable} -m pip")
+        return True
     
-    for pip_cmd in pip_commands:
-        try:
-            if ' -m ' in pip_cmd:
-                # For python -m pip, split the command
-                result = subprocess.run(pip_cmd.split(), 
-                                      stdout=subprocess.DEVNULL, 
-                                      stderr=subprocess.DEVNULL, 
-                                      check=True)
-            else:
-                result = subprocess.run([pip_cmd, '--version'], 
-                                      stdout=subprocess.DEVNULL, 
-                                      stderr=subprocess.DEVNULL, 
-                                      check=True)
-            print(f"✓ pip is available via: {pip_cmd}")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
+    # A fresh interpreter can still see pip when this one cannot, e.g. when the
+    # installer was started with `python -S` (site-packages not on sys.path)
+    try:
+        subprocess.run([sys.executable, '-m', 'pip', '--version'],
+                       stdin=subprocess.DEVNULL,
+                       stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL,
+                       check=True)
+        print(f"✓ pip is available via: {sys.executable} -m pip")
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        pass
     
     print("✗ pip is not available")
     print("Please install pip manually. It should be included with Python 3.4+")
@@ -66,9 +139,33 @@ def check_pip_availability():
     sys.exit(1)
 
 
+def _pump_stream(stream, sink):
+    """
+    Forward each line of a child process stream to a sink callable.
+    
+    Args:
+        stream (file): Text-mode pipe to read from
+        sink (callable): Called with each line, trailing newline removed
+    """
+    try:
+        for line in iter(stream.readline, ''):
+            sink(line.rstrip())
+    except Exception:
+        # Keep reading no matter what: if nobody drains the pipe, the child
+        # blocks once its buffer is full and the install never finishes
+        for _ in iter(lambda: stream.buffer.read(65536), b''):
+            pass
+    finally:
+        stream.close()
+
+
 def run_command(command, description, critical=True):
     """
-    Run a system command and handle errors.
+    Run a system command, streaming its output, and handle errors.
+    
+    Standard output is printed as it is produced instead of being buffered
+    until the command exits. Only the last lines of standard error are kept
+    to explain a failure.
     
     Args:
         command (list): Command to run as list of strings
@@ -78,77 +175,329 @@ def run_command(command, description, critical=True):
     Returns:
         bool: True if command succeeded, False otherwise
     """
-    print(f"Installing {description}...")
+    log(f"Installing {description}...")
     try:
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
-        print(f"✓ {description} installed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to install {description}")
-        print(f"Error: {e.stderr.strip()}")
-        if critical:
-            sys.exit(1)
-        return False
+        # No stdin: a child that decides to prompt fails instead of hanging
+        process = subprocess.Popen(command,
+                                   stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE,
+                                   text=True,
+                                   errors='replace',  # Never fail on undecodable output
+                                   bufsize=1)
     except FileNotFoundError:
-        print(f"✗ Command not found: {' '.join(command)}")
+        log(f"✗ Command not found: {' '.join(command)}")
         if critical:
-            print("Please install the required package manager first.")
+            log("Please install the required package manager first.")
             sys.exit(1)
         return False
+    
+    # Drain both pipes concurrently so neither can fill up and block the child
+    stderr_tail = deque(maxlen=40)
+    readers = [
+        threading.Thread(target=_pump_stream,
+                         args=(process.stdout, lambda line: log(f"  {line}")),
+                         daemon=True),
+        threading.Thread(target=_pump_stream,
+                         args=(process.stderr, stderr_tail.append),
+                         daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    process.wait()
+    for reader in readers:
+        reader.join()
+    
+    if process.returncode == 0:
+        log(f"✓ {description} installed successfully")
+        return True
+    
+    error = "\n".join(line for line in stderr_tail if line.strip())
+    log(f"✗ Failed to install {description}\nError: {error}")
+    if critical:
+        sys.exit(1)
+    return False
+
 
+# One dependency to install: a probe telling whether it is already present,
+# the (command, description) attempts to try in order, and a fallback
+# called when every attempt fails
+InstallStep = namedtuple('InstallStep', ['name', 'probe', 'attempts', 'fallback'])
 
-def install_pip_package(package_name, description):
+
+def pip_install_attempts(package_names, description):
     """
-    Install a Python package using pip on Windows.
+    Build the pip commands that install Python packages in one invocation.
     
     Args:
-        package_name (str): Name of the package to install
+        package_names (list): Names of the packages to install
         description (str): Description for user feedback
+        
+    Returns:
+        list: (command, description) tuples to try in order
     """
-    # Try pip first, then python -m pip
-    pip_commands = ['pip']
-    
-    for pip_cmd in pip_commands:
-        if shutil.which(pip_cmd):
-            command = [pip_cmd, 'install', '--upgrade', package_name]
-            if run_command(command, description, critical=False):
-                return True
+    # Use the pip of the interpreter running this script, so the packages
+    # land where youtube_downloader.py will import them from. Skip pip's PyPI
+    # self-version check and progress bar rendering. Our packages must come
+    # as wheels, and dependencies prefer a wheel over a newer sdist, so
+    # nothing has to be built locally
+    command = [sys.executable, '-m', 'pip', '--disable-pip-version-check', '--no-input',
+               'install', '--upgrade', '--prefer-binary',
+               '--only-binary', ','.join(package_names), '--progress-bar', 'off',
+               *package_names]
+    attempts = [(command, description)]
     
-    # Try with python -m pip
-    print(f"Trying python -m pip for {description}...")
-    command = [sys.executable, '-m', 'pip', 'install', '--upgrade', package_name]
-    return run_command(command, description, critical=True)
+    # Retry as a user install, usually needed for a system-wide Python without
+    # write access to site-packages. --user is invalid inside a virtual environment
+    if not IN_VIRTUALENV:
+        attempts.append((command + ['--user'], f"{description} for the current user"))
+    return attempts
 
 
-def install_windows_dependencies():
-    """Install dependencies on Windows."""
-    print("Installing dependencies for Windows")
-    print()
+def _python_packages_installed():
+    """
+    Check whether every Python package can be imported.
     
-    # Install yt-dlp
-    install_pip_package('yt-dlp', 'yt-dlp (YouTube downloader)')
+    find_spec only locates a module, it does not import it (yt_dlp is large).
     
-    # Check for ffmpeg
-    if shutil.which('ffmpeg'):
-        print("✓ ffmpeg is already installed")
-    else:
-        print("Installing ffmpeg...")
-        # Try winget first
-        if shutil.which('winget'):
-            if run_command(['winget', 'install', 'ffmpeg'], 'ffmpeg via winget', critical=False):
-                return
-        
-        # Try chocolatey
-        if shutil.which('choco'):
-            if run_command(['choco', 'install', 'ffmpeg', '-y'], 'ffmpeg via chocolatey', critical=False):
-                return
-        
+    Returns:
+        bool: True if all PYTHON_PACKAGES are installed, False otherwise
+    """
+    return all(importlib.util.find_spec(module_name) is not None
+               for _, module_name in PYTHON_PACKAGES)
+
+
+def _python_packages_install_failed():
+    """Exit, since the downloader cannot work without its Python packages."""
+    log("✗ Could not install the Python packages. See the pip errors above.")
+    sys.exit(1)
+
+
+def _print_ffmpeg_instructions():
+    """
+    Explain how to install ffmpeg by hand.
+    
+    Returns:
+        bool: Always False, since ffmpeg is still missing
+    """
+    with _print_lock:
         print("⚠ Could not install ffmpeg automatically.")
         print("Please install ffmpeg manually:")
         print("1. Download from: https://ffmpeg.org/download.html")
         print("2. Extract to a folder (e.g., C:\\ffmpeg)")
         print("3. Add the bin folder to your PATH environment variable")
         print("4. Or use: winget install ffmpeg")
+    return False
+
+
+def _add_to_user_path(directory):
+    """
+    Prepend a directory to the user's PATH, for this process and new consoles.
+    
+    Args:
+        directory (str): Directory to add
+        
+    Returns:
+        bool: True if the persistent user PATH was updated, False otherwise
+    """
+    with _path_lock:
+        os.environ['PATH'] = os.pathsep.join((directory, os.environ.get('PATH', '')))
+        which.cache_clear()
+    
+    try:
+        import winreg
+        import ctypes
+    except ImportError:
+        return False
+    
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0,
+                            winreg.KEY_READ | winreg.KEY_WRITE) as key:
+            try:
+                user_path, value_type = winreg.QueryValueEx(key, 'Path')
+            except FileNotFoundError:
+                user_path, value_type = '', winreg.REG_EXPAND_SZ
+            entries = [entry for entry in user_path.split(os.pathsep) if entry]
+            if directory not in entries:
+                winreg.SetValueEx(key, 'Path', 0, value_type,
+                                  os.pathsep.join([directory] + entries))
+    except OSError:
+        return False
+    
+    # Tell Explorer the environment changed so new consoles see the new PATH
+    HWND_BROADCAST, WM_SETTINGCHANGE, SMTO_ABORTIFHUNG = 0xFFFF, 0x001A, 0x0002
+    ctypes.windll.user32.SendMessageTimeoutW(HWND_BROADCAST, WM_SETTINGCHANGE, 0,
+                                             'Environment', SMTO_ABORTIFHUNG, 5000, None)
+    return True
+
+
+def _reload_path():
+    """
+    Add PATH entries saved in the registry since this process started.
+    
+    Package managers record new tool folders in the machine or user PATH,
+    which running processes do not see. Without this, ffmpeg installed by
+    winget or chocolatey would not be found until a new console is opened.
+    """
+    try:
+        import winreg
+    except ImportError:
+        which.cache_clear()
+        return
+    
+    saved_paths = []
+    for root, subkey in (
+            (winreg.HKEY_LOCAL_MACHINE, r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment'),
+            (winreg.HKEY_CURRENT_USER, 'Environment')):
+        try:
+            with winreg.OpenKey(root, subkey) as key:
+                saved_paths.append(winreg.QueryValueEx(key, 'Path')[0])
+        except OSError:
+            continue
+    
+    with _path_lock:
+        entries = os.environ.get('PATH', '').split(os.pathsep)
+        known = set(entries)
+        for saved_path in saved_paths:
+            for entry in saved_path.split(os.pathsep):
+                entry = os.path.expandvars(entry)
+                if entry and entry not in known:
+                    entries.append(entry)
+                    known.add(entry)
+        
+        # Update once, then forget lookups made against the old PATH
+        os.environ['PATH'] = os.pathsep.join(entries)
+        which.cache_clear()
+
+
+def install_ffmpeg_portable():
+    """
+    Download a static ffmpeg build into %LOCALAPPDATA%\\ffmpeg and add it to PATH.
+    
+    Used when neither winget nor chocolatey could install ffmpeg.
+    
+    Returns:
+        bool: True if ffmpeg was installed, False otherwise
+    """
+    target = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local')) / 'ffmpeg'
+    log("Installing ffmpeg from a static build...")
+    try:
+        # The build publishes its checksum next to the archive, as a bare hex digest
+        with urllib.request.urlopen(FFMPEG_ZIP_URL + '.sha256', timeout=60) as response:
+            expected = response.read().decode('ascii', errors='replace').split()[0].lower()
+        
+        # Spool the archive to disk, hashing it on the way; the build is around 100 MB
+        with urllib.request.urlopen(FFMPEG_ZIP_URL, timeout=60) as response, \
+                tempfile.TemporaryFile() as archive:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: response.read(1024 * 1024), b''):
+                digest.update(chunk)
+                archive.write(chunk)
+            if digest.hexdigest() != expected:
+                raise ValueError("checksum mismatch, the download is corrupt or incomplete")
+            with zipfile.ZipFile(archive) as zip_file:
+                # The archive holds one versioned folder, e.g. ffmpeg-7.1-essentials_build/bin
+                executables = [name for name in zip_file.namelist()
+                               if name.endswith('/bin/ffmpeg.exe')]
+                if not executables:
+                    raise zipfile.BadZipFile("ffmpeg.exe not found in the archive")
+                zip_file.extractall(target)
+    except (OSError, http.client.HTTPException, ValueError, IndexError, zipfile.BadZipFile) as e:
+        log(f"✗ Failed to download ffmpeg\nError: {e}")
+        return _print_ffmpeg_instructions()
+    
+    bin_dir = str(target / Path(executables[0]).parent)
+    if _add_to_user_path(bin_dir):
+        log(f"✓ ffmpeg installed successfully to {bin_dir}")
+    else:
+        log(f"✓ ffmpeg installed to {bin_dir}")
+        log("⚠ Add that folder to your PATH environment variable to use it.")
+    return True
+
+
+def get_windows_install_steps(tools):
+    """
+    Describe how each dependency is installed on Windows.
+    
+    Args:
+        tools (int): Package managers available, as returned by detect_tools
+        
+    Returns:
+        list: InstallStep for the Python packages and for ffmpeg
+    """
+    package_names = [package_name for package_name, _ in PYTHON_PACKAGES]
+    package_list = ', '.join(package_names)
+    
+    ffmpeg_attempts = []
+    # Try winget first, pinned to one package and source so it does not
+    # have to search every configured source (including msstore) first, and
+    # with the agreements pre-accepted since winget would otherwise prompt.
+    # Progress bars are turned off: each redraw would become a line of output
+    if tools & WINGET:
+        ffmpeg_attempts.append(
+            (['winget', 'install', '--id', 'Gyan.FFmpeg', '--exact', '--source', 'winget',
+              '--accept-package-agreements', '--accept-source-agreements',
+              '--disable-interactivity'],
+             'ffmpeg via winget'))
+    # Then chocolatey
+    if tools & CHOCO:
+        ffmpeg_attempts.append((['choco', 'install', 'ffmpeg', '-y', '--no-progress'],
+                                'ffmpeg via chocolatey'))
+    
+    return [
+        InstallStep(name=package_list,
+                    probe=_python_packages_installed,
+                    attempts=pip_install_attempts(package_names, f"Python packages ({package_list})"),
+                    fallback=_python_packages_install_failed),
+        InstallStep(name='ffmpeg',
+                    probe=lambda: which('ffmpeg') is not None,
+                    attempts=ffmpeg_attempts,
+                    # The static build is a Windows zip of .exe files
+                    fallback=install_ffmpeg_portable if os.name == 'nt' else _print_ffmpeg_instructions),
+    ]
+
+
+def run_install_step(step):
+    """
+    Install one dependency unless it is already present.
+    
+    Args:
+        step (InstallStep): The dependency to install
+        
+    Returns:
+        bool: True if the dependency is available afterwards, False otherwise
+    """
+    if step.probe():
+        log(f"✓ {step.name} is already installed")
+        return True
+    
+    for command, description in step.attempts:
+        if run_command(command, description, critical=False):
+            _reload_path()
+            return True
+    return step.fallback()
+
+
+def install_windows_dependencies(tools):
+    """
+    Install dependencies on Windows.
+    
+    The Python packages (pip/PyPI) and ffmpeg (winget/chocolatey) use unrelated tools and
+    are mostly network-bound, so all steps run at the same time. Each
+    step's attempts still run in order inside its own worker.
+    
+    Args:
+        tools (int): Package managers available, as returned by detect_tools
+    """
+    print("Installing dependencies for Windows")
+    print()
+    
+    steps = get_windows_install_steps(tools)
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = [executor.submit(run_install_step, step) for step in steps]
+        for future in as_completed(futures):
+            # Re-raise errors (including sys.exit from a failed pip install) here
+            future.result()
 
 
 def verify_installation():
@@ -157,16 +506,19 @@ def verify_installation():
     print("Verifying installation...")
     print()
     
-    # Check yt-dlp
-    try:
-        import yt_dlp
-        print("✓ yt-dlp is available")
-    except ImportError:
-        print("✗ yt-dlp is not available")
-        return False
+    # Check the Python packages without importing them (yt_dlp is large); drop
+    # the import system's directory caches first so new packages are seen
+    importlib.invalidate_caches()
+    for package_name, module_name in PYTHON_PACKAGES:
+        if importlib.util.find_spec(module_name) is not None:
+            print(f"✓ {package_name} is available")
+        else:
+            print(f"✗ {package_name} is not available")
+            return False
     
-    # Check ffmpeg
-    if shutil.which('ffmpeg'):
+    # Check ffmpeg (the installs above may have put it on PATH)
+    which.cache_clear()
+    if which('ffmpeg'):
         print("✓ ffmpeg is available")
     else:
         print("✗ ffmpeg is not available")
@@ -187,7 +539,7 @@ def main():
     print()
     
     # Install Windows dependencies
-    install_windows_dependencies()
+    install_windows_dependencies(detect_tools())
     
     # Verify installation
     print()
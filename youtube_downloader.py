@@ -12,18 +12,24 @@ Features:
 """
 
 import os
+import re
 import sys
 import time
 import threading
 import argparse
-import subprocess
+import importlib.util
+import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache, partial
 from pathlib import Path
-import yt_dlp
 
 class LoadingAnimation:
     """
     A thread-based loading animation that displays animated dots
     while background operations are running.
+    
+    When output is not a terminal (e.g. redirected to a file), the message
+    is printed once instead, so no carriage-return frames end up in the log.
     """
     
     def __init__(self, message="Fetching options"):
@@ -34,21 +40,27 @@ class LoadingAnimation:
             message (str): The base message to display during loading
         """
         self.message = message
-        self.running = False
         self.thread = None
+        self._stop_event = threading.Event()
+        self._interactive = sys.stdout.isatty()
     
     def start(self):
         """Start the loading animation in a separate thread."""
-        self.running = True
+        if not self._interactive:
+            print(f"{self.message}...")
+            return
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._animate)
         self.thread.daemon = True  # Dies when main thread dies
         self.thread.start()
     
     def stop(self):
         """Stop the loading animation and clear the line."""
-        self.running = False
+        self._stop_event.set()  # Wakes the animation thread immediately
         if self.thread:
             self.thread.join()
+        if not self._interactive:
+            return
         # Clear the loading line by overwriting with spaces
         sys.stdout.write('\r' + ' ' * (len(self.message) + 10) + '\r')
         sys.stdout.flush()
@@ -56,37 +68,114 @@ class LoadingAnimation:
     def _animate(self):
         """
         Internal method that handles the animation loop.
-        Cycles through 0-3 dots every 0.5 seconds.
+        Cycles through 0-3 dots every 0.5 seconds until stopped.
         """
         dots = 0
-        while self.running:
+        while True:
             dots = (dots + 1) % 4
             loading_text = self.message + '.' * dots + ' ' * (3 - dots)
             sys.stdout.write(f'\r{loading_text}')
             sys.stdout.flush()
-            time.sleep(0.5)
+            if self._stop_event.wait(0.5):
+                break
+
+class DownloadProgress:
+    """
+    yt-dlp progress hook that shows a throttled download percentage and
+    an animation while the downloaded file is post-processed.
+    """
+    
+    # Minimum seconds between two progress line updates
+    UPDATE_INTERVAL = 0.5
+    
+    def __init__(self, finishing_message, enabled=True):
+        """
+        Initialize the progress display.
+        
+        Args:
+            finishing_message (str): Animation message shown once a file is
+                downloaded (e.g. while merging or converting)
+            enabled (bool): Whether to show anything at all; disabled when
+                several downloads share the console
+        """
+        self.finishing_message = finishing_message
+        self.enabled = enabled
+        self.animation = None
+        self._last_update = 0.0
+        self._interactive = enabled and sys.stdout.isatty()
+    
+    def hook(self, d):
+        """Hook to track download progress and show the finishing animation."""
+        if _cancel_downloads.is_set():
+            from yt_dlp.utils import DownloadCancelled
+            raise DownloadCancelled()
+        
+        if d['status'] == 'downloading':
+            # Stop any existing animation during download
+            self.stop()
+            self._show_progress(d)
+        elif d['status'] == 'finished':
+            # Show the finishing animation when the download is done
+            if self.enabled and not self.animation:
+                self._show_progress(d, force=True)  # Final size, whatever the throttle
+                print()  # Add spacing
+                self.animation = LoadingAnimation(self.finishing_message)
+                self.animation.start()
+    
+    def stop(self):
+        """Stop the finishing animation if it's running."""
+        if self.animation:
+            self.animation.stop()
+            self.animation = None
+    
+    def _show_progress(self, d, force=False):
+        """
+        Overwrite the progress line, at most once per UPDATE_INTERVAL.
+        
+        Args:
+            d (dict): Progress information from yt-dlp
+            force (bool): Update even if the last update was too recent
+        """
+        if not self._interactive:
+            return
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        downloaded = d.get('downloaded_bytes') or 0
+        if d['status'] == 'finished':
+            # Files already on disk are reported with their size only
+            downloaded = downloaded or total or 0
+        if not downloaded:
+            return  # Nothing meaningful to show before the first byte
+        
+        now = time.monotonic()
+        if not force and now - self._last_update < self.UPDATE_INTERVAL:
+            return
+        self._last_update = now
+        
+        if total:
+            percent = min(downloaded / total * 100, 100)
+            line = f"Downloading: {percent:5.1f}% of {format_filesize(total)}"
+        else:
+            line = f"Downloading: {format_filesize(downloaded)}"
+        sys.stdout.write(f"\r{line.ljust(40)}")
+        sys.stdout.flush()
+
 
 def check_dependencies():
     """
     Check if required dependencies (yt-dlp and ffmpeg) are available.
     Provides installation instructions for missing dependencies on Windows.
     """
-    # Check for yt-dlp library
-    try:
-        import yt_dlp
-    except ImportError:
+    # Check for yt-dlp library without importing it yet (it is large and
+    # only loaded once a video is actually fetched)
+    if importlib.util.find_spec('yt_dlp') is None:
         print("Error: yt-dlp is not installed.")
         print("Please install it using:")
         print("  pip install yt-dlp")
         sys.exit(1)
     
-    # Check for ffmpeg (required for audio conversion and video merging)
-    try:
-        subprocess.run(['ffmpeg', '-version'], 
-                      stdout=subprocess.DEVNULL, 
-                      stderr=subprocess.DEVNULL, 
-                      check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check for ffmpeg (required for audio conversion and video merging).
+    # A PATH lookup is enough; running `ffmpeg -version` would start a process
+    if shutil.which('ffmpeg') is None:
         print("Warning: ffmpeg is not installed or not in PATH.")
         print("Audio conversion may not work properly.")
         print("To install ffmpeg:")
@@ -94,18 +183,43 @@ def check_dependencies():
         print("  Or use: winget install ffmpeg")
         print()
 
+@lru_cache(maxsize=1)
 def get_downloads_folder():
     """
-    Get the Windows downloads folder path.
+    Get the Windows downloads folder path, creating it on first use.
     
     Returns:
         str: Path to the downloads folder where files will be saved
     """
     # Windows: Use Downloads/Youtube Downloads
-    return str(Path.home() / "Downloads" / "Youtube Downloads")
+    downloads_path = str(Path.home() / "Downloads" / "Youtube Downloads")
+    
+    # Create download directory if it doesn't exist (once per run, thanks to the cache)
+    os.makedirs(downloads_path, exist_ok=True)
+    return downloads_path
+
+
+# Options shared by every yt-dlp call
+_YDL_BASE = {
+    'quiet': True,  # Suppress intermediate output
+    'no_warnings': True,  # Suppress warnings
+}
+
+# HTTP statuses YouTube answers with once a cached stream URL has expired
+_EXPIRED_URL_STATUSES = (403, 404, 410)
+
+# Set on Ctrl+C so parallel downloads stop at their next progress update
+_cancel_downloads = threading.Event()
 
 
 # Utility Functions
+
+# Size unit conversions used by format_filesize
+_BYTES_PER_GB = 1024 * 1024 * 1024
+_GB_PER_BYTE = 1.0 / _BYTES_PER_GB
+_MB_PER_BYTE = 1.0 / (1024 * 1024)
+
+
 def format_filesize(bytesize):
     """
     Convert bytes to appropriate unit (MB or GB) with 2 decimal places.
@@ -119,14 +233,10 @@ def format_filesize(bytesize):
     if not bytesize:
         return "Unknown"
     
-    # Convert to GB if size is 1 GB or larger
-    gb_size = bytesize / (1024 * 1024 * 1024)
-    if gb_size >= 1.0:
-        return f"{round(gb_size, 2)} GB"
-    else:
-        # Convert to MB for smaller sizes
-        mb_size = bytesize / (1024 * 1024)
-        return f"{round(mb_size, 2)} MB"
+    # Use GB if size is 1 GB or larger, MB for smaller sizes
+    if bytesize >= _BYTES_PER_GB:
+        return f"{bytesize * _GB_PER_BYTE:.2f} GB"
+    return f"{bytesize * _MB_PER_BYTE:.2f} MB"
 
 
 def format_duration(seconds):
@@ -152,31 +262,60 @@ def format_duration(seconds):
         return f"{minutes:02d}:{seconds:02d}"
 
 
-def get_best_audio_size(formats):
+# Video formats offered for download: containers and minimum resolution
+_ALLOWED_EXTS = frozenset({'mp4', 'webm'})
+_MIN_HEIGHT = 720
+
+
+def _partition_formats(formats):
     """
-    Get the file size of the best available audio format for size estimation.
+    Select displayable video formats and find the best audio size in one pass.
+    
+    Video formats must have a known height of at least _MIN_HEIGHT, a
+    container in _ALLOWED_EXTS and a known file size. The best audio format is the
+    audio-only format with a known file size and the highest bitrate.
     
     Args:
         formats (list): List of all available formats
         
     Returns:
-        int: File size of the best audio format in bytes
-    """
-    # Filter for audio-only formats with known file sizes
-    audio_formats = [
-        f for f in formats
-        if f.get('acodec') != 'none' and f.get('vcodec') == 'none'
-        and f.get('filesize')
-    ]
-    
-    if audio_formats:
-        # Find the best quality audio (highest bitrate)
-        best_audio = max(audio_formats, key=lambda x: x.get('abr', 0) or 0)
-        return best_audio.get('filesize', 0)
-    return 0
+        tuple: (list of matching video formats, file size of the best audio format in bytes)
+    """
+    video_formats = []
+    best_audio_size = 0
+    best_abr = None
+    
+    for f in formats:
+        # Read each key once per format
+        vcodec = f.get('vcodec')
+        filesize = f.get('filesize')
+        if not filesize:
+            continue  # Only formats with known file size
+        
+        if vcodec == 'none':
+            # Audio-only candidate for the size estimate (highest bitrate wins)
+            if f.get('acodec') != 'none':
+                abr = f.get('abr') or 0
+                if best_abr is None or abr > best_abr:
+                    best_abr = abr
+                    best_audio_size = filesize
+        else:
+            height = f.get('height')
+            if (height  # Must have height information
+                    and f.get('ext') in _ALLOWED_EXTS  # Compatible containers
+                    and height >= _MIN_HEIGHT):  # Only 720p or higher
+                video_formats.append(f)
+    
+    return video_formats, best_audio_size
 
 
 # Table Display Functions
+
+# Row templates for the format tables (column widths match the headers)
+_VIDEO_ROW_FORMAT = "| {:<2} | {:<10} | {:<6} | {:<8} | {:<9} | {:<14} |"
+_AUDIO_ROW_FORMAT = "| {:<2} | {:<11} | {:<8} | {:<9} | {:<14} |"
+
+
 def _print_video_formats_table(formats, best_audio_size):
     """
     Print a formatted table of video formats.
@@ -185,11 +324,14 @@ def _print_video_formats_table(formats, best_audio_size):
         formats (list): List of video formats to display
         best_audio_size (int): Size of best audio format for total size calculation
     """
-    print("+----+------------+--------+----------+-----------+----------------+")
-    print("|                      AVAILABLE VIDEO FORMATS                     |")
-    print("+----+------------+--------+----------+-----------+----------------+")
-    print("| #  | Resolution |  FPS   |  Codec   | Container | Estimated Size |")
-    print("+----+------------+--------+----------+-----------+----------------+")
+    border = "+----+------------+--------+----------+-----------+----------------+"
+    lines = [
+        border,
+        "|                      AVAILABLE VIDEO FORMATS                     |",
+        border,
+        "| #  | Resolution |  FPS   |  Codec   | Container | Estimated Size |",
+        border,
+    ]
 
     for i, format_info in enumerate(formats):
         # Extract and format resolution
@@ -207,10 +349,12 @@ def _print_video_formats_table(formats, best_audio_size):
         total_size = video_size + best_audio_size
         size_str = format_filesize(total_size)
         
-        # Print formatted row
-        print(f"| {str(i+1).ljust(2)} | {res.ljust(10)} | {fps.ljust(6)} | {codec.ljust(8)} | {container.ljust(9)} | {size_str.ljust(14)} |")
+        # Add formatted row
+        lines.append(_VIDEO_ROW_FORMAT.format(i + 1, res, fps, codec, container, size_str))
 
-    print("+----+------------+--------+----------+-----------+----------------+")
+    lines.append(border)
+    # Write the whole table at once (one console write instead of one per line)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _print_audio_formats_table(formats):
@@ -220,11 +364,14 @@ def _print_audio_formats_table(formats):
     Args:
         formats (list): List of audio formats to display
     """
-    print("+----+-------------+----------+-----------+----------------+")
-    print("|                 AVAILABLE AUDIO FORMATS                  |")
-    print("+----+-------------+----------+-----------+----------------+")
-    print("| #  |   Quality   |  Codec   | Container |      Size      |")
-    print("+----+-------------+----------+-----------+----------------+")
+    border = "+----+-------------+----------+-----------+----------------+"
+    lines = [
+        border,
+        "|                 AVAILABLE AUDIO FORMATS                  |",
+        border,
+        "| #  |   Quality   |  Codec   | Container |      Size      |",
+        border,
+    ]
 
     for i, format_info in enumerate(formats):
         # Extract format details
@@ -233,13 +380,66 @@ def _print_audio_formats_table(formats):
         container = format_info.get('ext', '?')
         size = format_filesize(format_info.get('filesize'))
         
-        # Print formatted row
-        print(f"| {str(i+1).ljust(2)} | {quality.ljust(11)} | {codec.ljust(8)} | {container.ljust(9)} | {size.ljust(14)} |")
+        # Add formatted row
+        lines.append(_AUDIO_ROW_FORMAT.format(i + 1, quality, codec, container, size))
 
-    print("+----+-------------+----------+-----------+----------------+")
+    lines.append(border)
+    # Write the whole table at once (one console write instead of one per line)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Format Listing Functions
+
+# Extracted video information, keyed by YouTube video ID
+_info_cache = {}
+
+# Matches the video ID in watch, youtu.be, shorts, embed and live URLs
+_VIDEO_ID_PATTERN = re.compile(r'(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/)([\w-]{11})')
+
+
+def _normalize_video_id(url):
+    """
+    Extract the 11-character YouTube video ID from a URL.
+    
+    Args:
+        url (str): YouTube video URL
+        
+    Returns:
+        str: The video ID, or the URL itself if no ID could be found
+    """
+    match = _VIDEO_ID_PATTERN.search(url)
+    return match.group(1) if match else url
+
+
+def _get_info(url):
+    """
+    Extract video information and available formats, reusing earlier results.
+    
+    Different URLs for the same video (e.g. youtube.com/watch?v= and
+    youtu.be/) share one cache entry.
+    
+    Args:
+        url (str): YouTube video URL
+        
+    Returns:
+        dict: Video information as returned by yt-dlp
+    """
+    video_id = _normalize_video_id(url)
+    info = _info_cache.get(video_id)
+    if info is None:
+        # Configure yt-dlp options for format extraction
+        ydl_opts = {
+            **_YDL_BASE,
+            'check_formats': False,  # Don't test-download formats while listing them
+            'skip_download': True,  # Only extract metadata, don't download
+        }
+        import yt_dlp  # Imported on first use to keep startup (and --help) fast
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+        _info_cache[video_id] = info
+    return info
+
+
 def list_formats(url, loading_animation=None):
     """
     Extract and display available video formats from a YouTube URL.
@@ -251,61 +451,43 @@ def list_formats(url, loading_animation=None):
     Returns:
         list: List of filtered video formats, or empty list on error
     """
-    # Configure yt-dlp options for format extraction
-    ydl_opts = {
-        'quiet': True,  # Suppress verbose output
-        'no_warnings': True,  # Suppress warnings during format extraction
-        'skip_download': True,  # Only extract metadata, don't download
-        'forcejson': True,  # Force JSON output format
-    }
-
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        try:
-            # Extract video information and available formats
-            info = ydl.extract_info(url, download=False)
-            formats = info['formats']
-
-            # Stop loading animation before showing results
-            if loading_animation:
-                loading_animation.stop()
-
-            # Get estimated audio size for total size calculation
-            best_audio_size = get_best_audio_size(formats)
-
-            # Filter formats based on quality and compatibility criteria
-            filtered = [
-                f for f in formats
-                if f.get('vcodec') != 'none'  # Must have video codec
-                and f.get('height')  # Must have height information
-                and f.get('ext') in ['mp4', 'webm']  # Compatible containers
-                and f.get('height', 0) >= 720  # Only 720p or higher
-                and f.get('filesize')  # Only formats with known file size
-            ]
-
-            # Sort by quality (height) descending, then by file size ascending
-            # This ensures best quality appears first, with smallest file size for same quality
-            filtered.sort(key=lambda x: (-x.get('height', 0), x.get('filesize', 0)))
-
-            # Display video information
-            print(f"Title: {info.get('title')}")
-            channel = info.get('uploader') or info.get('channel')
-            if channel:
-                print(f"Channel: {channel}")
-            duration = info.get('duration')
-            if duration:
-                print(f"Duration: {format_duration(duration)}")
-            print()
-            
-            # Display formatted table of available formats
-            _print_video_formats_table(filtered, best_audio_size)
+    try:
+        # Extract video information and available formats
+        info = _get_info(url)
+        formats = info['formats']
+
+        # Stop loading animation before showing results
+        if loading_animation:
+            loading_animation.stop()
+
+        # Filter formats based on quality and compatibility criteria, and get
+        # the estimated audio size for total size calculation
+        filtered, best_audio_size = _partition_formats(formats)
+
+        # Sort by quality (height) descending, then by file size ascending
+        # This ensures best quality appears first, with smallest file size for same quality
+        filtered.sort(key=lambda x: (-x.get('height', 0), x.get('filesize', 0)))
+
+        # Display video information
+        print(f"Title: {info.get('title')}")
+        channel = info.get('uploader') or info.get('channel')
+        if channel:
+            print(f"Channel: {channel}")
+        duration = info.get('duration')
+        if duration:
+            print(f"Duration: {format_duration(duration)}")
+        print()
+        
+        # Display formatted table of available formats
+        _print_video_formats_table(filtered, best_audio_size)
 
-            return filtered
-            
-        except Exception as e:
-            if loading_animation:
-                loading_animation.stop()
-            print(f"\nError retrieving formats: {e}")
-            return []
+        return filtered
+        
+    except Exception as e:
+        if loading_animation:
+            loading_animation.stop()
+        print(f"\nError retrieving formats: {e}")
+        return []
 
 
 def list_audio_formats(url, loading_animation=None):
@@ -319,88 +501,110 @@ def list_audio_formats(url, loading_animation=None):
     Returns:
         list: List of filtered audio formats, or empty list on error
     """
-    # Configure yt-dlp options for format extraction
-    ydl_opts = {
-        'quiet': True,  # Suppress verbose output
-        'no_warnings': True,  # Suppress warnings during format extraction
-        'skip_download': True,  # Only extract metadata, don't download
-        'forcejson': True,  # Force JSON output format
-    }
-
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        try:
-            # Extract video information and available formats
-            info = ydl.extract_info(url, download=False)
-            formats = info['formats']
-
-            # Stop loading animation before showing results
-            if loading_animation:
-                loading_animation.stop()
-
-            # Filter for audio-only formats with quality information
-            filtered = [
-                f for f in formats
-                if f.get('acodec') != 'none' and f.get('vcodec') == 'none'  # Audio only
-                and f.get('filesize')  # Only formats with known file size
-                and f.get('abr')  # Only formats with bitrate info
-            ]
-
-            # Sort by bitrate descending (best quality first), then by file size ascending
-            filtered.sort(key=lambda x: (-x.get('abr', 0), x.get('filesize', 0)))
-
-            # Display video information
-            print(f"\nTitle: {info.get('title')}")
-            duration = info.get('duration')
-            if duration:
-                print(f"Duration: {format_duration(duration)}")
-            print()
-            
-            # Display formatted table of available audio formats
-            _print_audio_formats_table(filtered)
+    try:
+        # Extract video information and available formats
+        info = _get_info(url)
+        formats = info['formats']
+
+        # Stop loading animation before showing results
+        if loading_animation:
+            loading_animation.stop()
+
+        # Filter for audio-only formats with quality information
+        filtered = [
+            f for f in formats
+            if f.get('acodec') != 'none' and f.get('vcodec') == 'none'  # Audio only
+            and f.get('filesize')  # Only formats with known file size
+            and f.get('abr')  # Only formats with bitrate info
+        ]
+
+        # Sort by bitrate descending (best quality first), then by file size ascending
+        filtered.sort(key=lambda x: (-x.get('abr', 0), x.get('filesize', 0)))
+
+        # Display video information
+        print(f"\nTitle: {info.get('title')}")
+        duration = info.get('duration')
+        if duration:
+            print(f"Duration: {format_duration(duration)}")
+        print()
+        
+        # Display formatted table of available audio formats
+        _print_audio_formats_table(filtered)
 
-            return filtered
-            
-        except Exception as e:
-            if loading_animation:
-                loading_animation.stop()
-            print(f"\nError retrieving audio formats: {e}")
-            return []
+        return filtered
+        
+    except Exception as e:
+        if loading_animation:
+            loading_animation.stop()
+        print(f"\nError retrieving audio formats: {e}")
+        return []
 
 
 # Download Functions
-def download_selected_format(url, format_id):
+def _download_label(url, info, show_progress):
+    """
+    Name a download in its messages when several share the console.
+    
+    Args:
+        url (str): YouTube video URL
+        info (dict, optional): Already extracted video information
+        show_progress (bool): False for parallel downloads
+        
+    Returns:
+        str: " (title)" or " (url)" for parallel downloads, empty otherwise
+    """
+    if show_progress:
+        return ""
+    return f" ({(info or {}).get('title') or url})"
+
+
+def _download(ydl, url, info=None):
+    """
+    Download a video, reusing already extracted information when available.
+    
+    Args:
+        ydl (yt_dlp.YoutubeDL): Downloader configured with the download options
+        url (str): YouTube video URL
+        info (dict, optional): Information previously returned by extract_info
+    """
+    if info is None:
+        ydl.download([url])
+        return
+    
+    from yt_dlp.networking.exceptions import HTTPError
+    from yt_dlp.utils import DownloadError
+    try:
+        # Same path as yt-dlp's --load-info-json: re-select formats with this
+        # downloader's options without extracting again. sanitize_info fills in
+        # missing keys in place, so give it a copy to keep the cached info intact
+        ydl.process_ie_result(ydl.sanitize_info(dict(info), remove_private_keys=True), download=True)
+    except DownloadError as e:
+        # Only expired or revoked stream URLs are worth extracting again;
+        # any other failure (post-processing, disk, ...) would just repeat
+        cause = e.exc_info[1] if e.exc_info else None
+        if not (isinstance(cause, HTTPError) and cause.status in _EXPIRED_URL_STATUSES):
+            raise
+        ydl.download([url])
+
+
+def download_selected_format(url, format_id, info=None, show_progress=True):
     """
     Download a specific video format with audio merged.
     
     Args:
         url (str): YouTube video URL
         format_id (str): Format ID of the selected video quality
+        info (dict, optional): Already extracted video information, to skip
+            extracting it again
+        show_progress (bool): Show progress and animations (off for parallel downloads)
     """
     downloads_path = get_downloads_folder()
-    
-    # Animation control variables
-    merging_animation = None
-    
-    def progress_hook(d):
-        """Hook to track download progress and show merging animation."""
-        nonlocal merging_animation
-        
-        if d['status'] == 'downloading':
-            # Stop any existing animation during download
-            if merging_animation:
-                merging_animation.stop()
-                merging_animation = None
-        elif d['status'] == 'finished':
-            # Show merging animation when starting to merge
-            if not merging_animation:
-                print()  # Add spacing
-                merging_animation = LoadingAnimation("Merging video and audio")
-                merging_animation.start()
+    progress = DownloadProgress("Merging video and audio", show_progress)
+    label = _download_label(url, info, show_progress)
     
     # Configure yt-dlp options for video download
     ydl_opts = {
-        'quiet': True,  # Suppress intermediate output
-        'no_warnings': True,  # Suppress warnings
+        **_YDL_BASE,
         'outtmpl': os.path.join(downloads_path, '%(title)s.%(ext)s'),  # Output filename template
         'format': f"{format_id}+bestaudio/best",  # Download video + best audio
         'merge_output_format': 'mp4',  # Merge to MP4 container
@@ -408,62 +612,48 @@ def download_selected_format(url, format_id):
             '-c:v', 'copy',  # Keep video without re-encoding (faster)
             '-c:a', 'aac'    # Convert audio to AAC (compatible)
         ],
-        'progress_hooks': [progress_hook]  # Add progress hook for animations
+        'concurrent_fragment_downloads': 4,  # Fetch DASH/HLS fragments in parallel
+        'noprogress': True,  # Skip yt-dlp's own progress bar rendering
+        'progress_hooks': [progress.hook]  # Show progress and animations ourselves
     }
 
-    # Create download directory if it doesn't exist
-    os.makedirs(downloads_path, exist_ok=True)
-
+    import yt_dlp  # Already loaded by _get_info in the normal flow
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         try:
-            print(f"\nDownloading format {format_id} to: {downloads_path}")
-            ydl.download([url])
+            print(f"\nDownloading format {format_id}{label} to: {downloads_path}")
+            _download(ydl, url, info)
             
             # Stop merging animation if it's running
-            if merging_animation:
-                merging_animation.stop()
+            progress.stop()
             
-            print("\nDownload complete!")
+            print(f"\nDownload complete{label}!")
+        except yt_dlp.utils.DownloadCancelled:
+            # Ctrl+C during parallel downloads; main reports the interruption
+            progress.stop()
         except Exception as e:
             # Stop animation on error
-            if merging_animation:
-                merging_animation.stop()
-            print(f"\nDownload failed: {e}")
+            progress.stop()
+            print(f"\nDownload failed{label}: {e}")
 
 
-def download_selected_audio(url, format_id):
+def download_selected_audio(url, format_id, info=None, show_progress=True):
     """
     Download a specific audio format and convert to MP3.
     
     Args:
         url (str): YouTube video URL
         format_id (str): Format ID of the selected audio quality
+        info (dict, optional): Already extracted video information, to skip
+            extracting it again
+        show_progress (bool): Show progress and animations (off for parallel downloads)
     """
     downloads_path = get_downloads_folder()
-    
-    # Animation control variables
-    converting_animation = None
-    
-    def progress_hook(d):
-        """Hook to track download progress and show converting animation."""
-        nonlocal converting_animation
-        
-        if d['status'] == 'downloading':
-            # Stop any existing animation during download
-            if converting_animation:
-                converting_animation.stop()
-                converting_animation = None
-        elif d['status'] == 'finished':
-            # Show converting animation when starting to convert
-            if not converting_animation:
-                print()  # Add spacing
-                converting_animation = LoadingAnimation("Converting to MP3")
-                converting_animation.start()
+    progress = DownloadProgress("Converting to MP3", show_progress)
+    label = _download_label(url, info, show_progress)
     
     # Configure yt-dlp options for audio download
     ydl_opts = {
-        'quiet': True,  # Suppress intermediate output
-        'no_warnings': True,  # Suppress warnings
+        **_YDL_BASE,
         'outtmpl': os.path.join(downloads_path, '%(title)s.%(ext)s'),  # Output filename template
         'format': format_id,  # Download specific audio format
         'postprocessors': [{
@@ -471,27 +661,28 @@ def download_selected_audio(url, format_id):
             'preferredcodec': 'mp3',  # Convert to MP3
             'preferredquality': '192',  # Set MP3 quality to 192 kbps
         }],
-        'progress_hooks': [progress_hook]  # Add progress hook for animations
+        'concurrent_fragment_downloads': 4,  # Fetch DASH/HLS fragments in parallel
+        'noprogress': True,  # Skip yt-dlp's own progress bar rendering
+        'progress_hooks': [progress.hook]  # Show progress and animations ourselves
     }
 
-    # Create download directory if it doesn't exist
-    os.makedirs(downloads_path, exist_ok=True)
-
+    import yt_dlp  # Already loaded by _get_info in the normal flow
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         try:
-            print(f"\nDownloading audio format {format_id} to: {downloads_path}")
-            ydl.download([url])
+            print(f"\nDownloading audio format {format_id}{label} to: {downloads_path}")
+            _download(ydl, url, info)
             
             # Stop converting animation if it's running
-            if converting_animation:
-                converting_animation.stop()
+            progress.stop()
             
-            print("\nAudio download complete!")
+            print(f"\nAudio download complete{label}!")
+        except yt_dlp.utils.DownloadCancelled:
+            # Ctrl+C during parallel downloads; main reports the interruption
+            progress.stop()
         except Exception as e:
             # Stop animation on error
-            if converting_animation:
-                converting_animation.stop()
-            print(f"\nAudio download failed: {e}")
+            progress.stop()
+            print(f"\nAudio download failed{label}: {e}")
 
 
 def download_audio_only(url):
@@ -502,29 +693,10 @@ def download_audio_only(url):
         url (str): YouTube video URL
     """
     downloads_path = get_downloads_folder()
-    
-    # Animation control variables
-    converting_animation = None
-    
-    def progress_hook(d):
-        """Hook to track download progress and show converting animation."""
-        nonlocal converting_animation
-        
-        if d['status'] == 'downloading':
-            # Stop any existing animation during download
-            if converting_animation:
-                converting_animation.stop()
-                converting_animation = None
-        elif d['status'] == 'finished':
-            # Show converting animation when starting to convert
-            if not converting_animation:
-                print()  # Add spacing
-                converting_animation = LoadingAnimation("Converting to MP3")
-                converting_animation.start()
+    progress = DownloadProgress("Converting to MP3")
     
     ydl_opts = {
-        'quiet': True,  # Suppress intermediate output
-        'no_warnings': True,  # Suppress warnings
+        **_YDL_BASE,
         'outtmpl': os.path.join(downloads_path, '%(title)s.%(ext)s'),
         'format': 'bestaudio/best',
         'postprocessors': [{
@@ -532,23 +704,24 @@ def download_audio_only(url):
             'preferredcodec': 'mp3',
             'preferredquality': '192',
         }],
-        'progress_hooks': [progress_hook]  # Add progress hook for animations
+        'concurrent_fragment_downloads': 4,  # Fetch DASH/HLS fragments in parallel
+        'noprogress': True,  # Skip yt-dlp's own progress bar rendering
+        'progress_hooks': [progress.hook]  # Show progress and animations ourselves
     }
 
+    import yt_dlp  # Already loaded by _get_info in the normal flow
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         try:
             print(f"\nDownloading audio to: {downloads_path}")
             ydl.download([url])
             
             # Stop converting animation if it's running
-            if converting_animation:
-                converting_animation.stop()
+            progress.stop()
             
             print("\nAudio download complete!")
         except Exception as e:
             # Stop animation on error
-            if converting_animation:
-                converting_animation.stop()
+            progress.stop()
             print(f"\nAudio download failed: {e}")
 
 def main():
@@ -557,41 +730,80 @@ def main():
     Handles command line arguments, user input validation, and orchestrates
     the download process based on user preferences.
     """
-    # Check that all required dependencies are available
-    check_dependencies()
-    
     # Parse and handle command line arguments
     parser = argparse.ArgumentParser(
         description='Download YouTube videos or audio',
         epilog='Examples:\n'
                '  python youtube_downloader.py                  # Download video\n'
-               '  python youtube_downloader.py --audio-only     # Download audio only',
+               '  python youtube_downloader.py --audio-only     # Download audio only\n'
+               '  python youtube_downloader.py URL1 URL2        # Download several videos',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
+    parser.add_argument('urls', nargs='*', metavar='URL',
+                       help='YouTube video URLs (prompted for if omitted)')
     parser.add_argument('--audio-only', '-a', action='store_true', 
                        help='Download only audio (MP3 format)')
+    parser.add_argument('--parallel-downloads', '-p', type=int, default=4, metavar='N',
+                       help='Maximum simultaneous downloads when several URLs are given (default: 4)')
     args = parser.parse_args()
+    if args.parallel_downloads < 1:
+        parser.error("--parallel-downloads must be at least 1")
 
-    # Get and validate YouTube URL from user
-    url = input("Enter the YouTube video URL: ").strip()
-    if not url:
-        print("URL cannot be empty.")
-        return
+    # Check that all required dependencies are available
+    check_dependencies()
+
+    # Get and validate YouTube URL from user if none were given
+    urls = args.urls
+    if not urls:
+        url = input("Enter the YouTube video URL: ").strip()
+        if not url:
+            print("URL cannot be empty.")
+            return
+        urls = [url]
 
-    # Handle audio-only download mode
+    # Choose formats one URL at a time, since it needs user input
     if args.audio_only:
-        _handle_audio_download(url)
+        # Handle audio-only download mode
+        downloads = [_prepare_audio_download(url) for url in urls]
     else:
         # Handle standard video download mode
-        _handle_video_download(url)
+        downloads = [_prepare_video_download(url) for url in urls]
+    downloads = [download for download in downloads if download]
+
+    if len(downloads) == 1:
+        downloads[0]()
+    elif downloads:
+        # Downloads are network-bound and independent, so run them together.
+        # Progress lines would overwrite each other, so they are turned off
+        print(f"\nStarting {len(downloads)} downloads...")
+        executor = ThreadPoolExecutor(max_workers=args.parallel_downloads)
+        pending = [executor.submit(download, show_progress=False) for download in downloads]
+        try:
+            # Wait in short slices: on Windows a blocking wait ignores Ctrl+C
+            while pending:
+                _, pending = wait(pending, timeout=0.5)
+        except KeyboardInterrupt:
+            # Drop queued downloads and make running ones stop at their next
+            # progress update instead of letting them finish
+            _cancel_downloads.set()
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+            # Let the running ones wind down so nothing prints after the goodbye
+            wait(pending)
+            raise
+        executor.shutdown()
 
 
-def _handle_audio_download(url):
+def _prepare_audio_download(url):
     """
-    Handle the audio-only download workflow.
+    Handle the audio-only download workflow up to the user's format choice.
     
     Args:
         url (str): YouTube video URL
+        
+    Returns:
+        callable: Starts the download when called, or None if nothing was selected
     """
     print()  # Add visual spacing
     loading = LoadingAnimation("Fetching audio options")
@@ -600,20 +812,25 @@ def _handle_audio_download(url):
     # Get available audio formats
     audio_formats = list_audio_formats(url, loading)
     if not audio_formats:
-        return
+        return None
 
     # Get user's format selection
     selected_format = _get_user_format_choice(audio_formats, "audio")
-    if selected_format:
-        download_selected_audio(url, selected_format)
+    if not selected_format:
+        return None
+    # Reuse the information fetched for the format list
+    return partial(download_selected_audio, url, selected_format, _get_info(url))
 
 
-def _handle_video_download(url):
+def _prepare_video_download(url):
     """
-    Handle the video download workflow.
+    Handle the video download workflow up to the user's format choice.
     
     Args:
         url (str): YouTube video URL
+        
+    Returns:
+        callable: Starts the download when called, or None if nothing was selected
     """
     print()  # Add visual spacing
     loading = LoadingAnimation("Fetching options")
@@ -622,12 +839,14 @@ def _handle_video_download(url):
     # Get available video formats
     formats = list_formats(url, loading)
     if not formats:
-        return
+        return None
 
     # Get user's format selection
     selected_format = _get_user_format_choice(formats, "format")
-    if selected_format:
-        download_selected_format(url, selected_format)
+    if not selected_format:
+        return None
+    # Reuse the information fetched for the format list
+    return partial(download_selected_format, url, selected_format, _get_info(url))
 
 
 def _get_user_format_choice(formats, format_type):